@@ -0,0 +1,264 @@
+import csv
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from scripts.text_utils import BOOLEAN_VALUES
+
+_SPECIAL_CHARS = ( ",", '"', "\r", "\n" )
+
+
+def _split_records(
+        lines: Iterable[ str ] ) -> Iterator[ Tuple[ List[ str ], str ] ]:
+    """Yield each CSV record together with the exact text it was parsed from.
+
+    ``csv.reader`` pulls one physical line at a time, so recording the lines it
+    consumes gives the raw text of each record, including quoted fields that
+    span several lines.
+
+    Args:
+        lines: Lines of a file opened with ``newline=""``
+
+    Yields:
+        Tuple[List[str], str]: Parsed fields and raw record text
+    """
+    consumed: List[ str ] = []
+
+    def recording() -> Iterator[ str ]:
+        for line in lines:
+            consumed.append( line )
+            yield line
+
+    for fields in csv.reader( recording() ):
+        raw = "".join( consumed )
+        consumed.clear()
+        yield fields, raw
+
+
+def _quoted_fields( raw: str ) -> List[ bool ]:
+    """Return, for each field of a raw record, whether it was quoted."""
+    flags: List[ bool ] = []
+    i, n = 0, len( raw )
+    while True:
+        quoted = i < n and raw[ i ] == '"'
+        flags.append( quoted )
+        if quoted:
+            i += 1
+            while i < n:
+                if raw[ i ] == '"':
+                    if i + 1 < n and raw[ i + 1 ] == '"':
+                        i += 2
+                        continue
+                    i += 1
+                    break
+                i += 1
+        while i < n and raw[ i ] not in ",\r\n":
+            i += 1
+        if i < n and raw[ i ] == ",":
+            i += 1
+            continue
+        return flags
+
+
+def _line_ending( raw: str ) -> str:
+    """Return the line terminator a raw record ends with (may be empty)."""
+    return raw[ len( raw.rstrip( "\r\n" ) ): ]
+
+
+def _value_kind( value: str ) -> str:
+    """Classify a field value as ``boolean``, ``numeric`` or ``text``."""
+    if value in BOOLEAN_VALUES:
+        return "boolean"
+    if value.isdigit():
+        return "numeric"
+    return "text"
+
+
+def _default_quoted( value: str ) -> bool:
+    """Quoting for a field with no original to copy: quote text only."""
+    return _value_kind( value ) == "text"
+
+
+def _format_field( value: str, quoted: bool ) -> str:
+    """Serialize one field, quoting it if requested or required."""
+    if quoted or any( char in value for char in _SPECIAL_CHARS ):
+        return '"' + value.replace( '"', '""' ) + '"'
+    return value
+
+
+def _format_record( values: Sequence[ str ], quoting: Sequence[ bool ],
+                    ending: str ) -> str:
+    """Serialize a record with per-field quoting and a line terminator."""
+    return ",".join(
+        _format_field( value, quoted )
+        for value, quoted in zip( values, quoting ) ) + ending
+
+
+def _as_text( value: Optional[ object ] ) -> str:
+    """Convert a row value to its CSV text, treating None as empty."""
+    return "" if value is None else str( value )
+
+
+def _field_quoting(
+        fieldnames: Sequence[ str ], values: Sequence[ str ],
+        original: Dict[ str, str ], record_quoting: Dict[ str, bool ],
+        column_quoting: Dict[ str, Dict[ str, bool ] ] ) -> List[ bool ]:
+    """Choose quoting per field.
+
+    A field keeps the record's original quoting while its value stays the same
+    kind (boolean, numeric or text). Otherwise it uses the quoting first seen
+    for that kind in the column, else ``_default_quoted``. The choice never
+    depends on which row changed, so a column's style does not drift.
+
+    Args:
+        fieldnames: Column names being written
+        values: Values being written, aligned with ``fieldnames``
+        original: Original values of the record by column
+        record_quoting: Quoting of the record's original fields by column
+        column_quoting: Quoting per column and value kind seen in the file
+
+    Returns:
+        List[bool]: Whether to quote each field
+    """
+    quoting = []
+    for name, value in zip( fieldnames, values ):
+        kind = _value_kind( value )
+        if name in record_quoting and _value_kind( original.get(
+                name, "" ) ) == kind:
+            quoting.append( record_quoting[ name ] )
+        else:
+            quoting.append(
+                column_quoting.get( name,
+                                    {} ).get( kind,
+                                              _default_quoted( value ) ) )
+    return quoting
+
+
+def _observe_quoting( column_quoting: Dict[ str, Dict[ str, bool ] ],
+                      original: Dict[ str, str ],
+                      record_quoting: Dict[ str, bool ] ) -> None:
+    """Record the first quoting seen for each column and value kind."""
+    for name, quoted in record_quoting.items():
+        kinds = column_quoting.setdefault( name, {} )
+        kinds.setdefault( _value_kind( original.get( name, "" ) ), quoted )
+
+
+def _splice_header( fields: List[ str ], raw: str,
+                    fieldnames: List[ str ] ) -> Tuple[ str, bool ]:
+    """Return the header text to write and whether it changed.
+
+    Args:
+        fields: Parsed header of the existing file
+        raw: Raw text of the existing header
+        fieldnames: Column names to write
+
+    Returns:
+        Tuple[str, bool]: Header text and whether it differs from ``raw``
+    """
+    if fields == fieldnames:
+        return raw, False
+    header_quoting = dict( zip( fields, _quoted_fields( raw ) ) )
+    quoting = [ header_quoting.get( name, False ) for name in fieldnames ]
+    return _format_record( fieldnames, quoting, _line_ending( raw ) ), True
+
+
+def _splice_record(
+        header: List[ str ], original: Dict[ str,
+                                             str ], raw: str, row: Dict[ str,
+                                                                         str ],
+        fieldnames: List[ str ], record_quoting: Dict[ str, bool ],
+        column_quoting: Dict[ str, Dict[ str, bool ] ] ) -> Tuple[ str, bool ]:
+    """Return the text to write for one data record and whether it changed.
+
+    Args:
+        header: Parsed header of the existing file
+        original: Original values of the record by column
+        raw: Raw text of the existing record
+        row: New values for the record
+        fieldnames: Column names to write
+        record_quoting: Quoting of the record's original fields by column
+        column_quoting: Quoting per column and value kind seen in the file
+
+    Returns:
+        Tuple[str, bool]: Record text and whether it differs from ``raw``
+    """
+    values = [ _as_text( row.get( name ) ) for name in fieldnames ]
+    if header == fieldnames and all(
+            original.get( name, "" ) == value
+            for name, value in zip( fieldnames, values ) ):
+        return raw, False
+    quoting = _field_quoting( fieldnames, values, original, record_quoting,
+                              column_quoting )
+    return _format_record( values, quoting, _line_ending( raw ) ), True
+
+
+def write_csv_minimal_diff( csv_file: str, rows: List[ Dict[ str, str ] ],
+                            fieldnames: List[ str ] ) -> bool:
+    """Write rows to an existing CSV file, rewriting only rows that changed.
+
+    ``rows`` are matched to the file's records by position. Records whose
+    values are unchanged keep their original text byte for byte; changed
+    records are re-serialized with the quoting each field had before and
+    their original line ending, as long as each value keeps its kind; values
+    that change kind, and new columns, quote text but not booleans or
+    integers, matching ``table.csv``. The file is read in one pass and
+    written only if at least one record changed.
+
+    Args:
+        csv_file: Path to the CSV file
+        rows: Rows to write, in file order
+        fieldnames: Column names to write
+
+    Returns:
+        bool: True if the file was written, False if nothing changed
+    """
+    fieldnames = list( fieldnames )
+    pieces: List[ str ] = []
+    changed = False
+    header: Optional[ List[ str ] ] = None
+    terminator = "\n"
+    column_quoting: Dict[ str, Dict[ str, bool ] ] = {}
+    pending = iter( rows )
+
+    with open( csv_file, "r", newline="" ) as f:
+        for fields, raw in _split_records( f ):
+            if header is None:
+                header = fields
+                terminator = _line_ending( raw ) or terminator
+                text, piece_changed = _splice_header( fields, raw, fieldnames )
+            elif not fields:                                                 # blank line
+                text, piece_changed = raw, False
+            else:
+                row = next( pending, None )
+                if row is None:                                              # row removed
+                    changed = True
+                    continue
+                original = dict( zip( header, fields ) )
+                record_quoting = dict( zip( header, _quoted_fields( raw ) ) )
+                text, piece_changed = _splice_record( header, original, raw,
+                                                      row, fieldnames,
+                                                      record_quoting,
+                                                      column_quoting )
+                _observe_quoting( column_quoting, original, record_quoting )
+            pieces.append( text )
+            changed = changed or piece_changed
+
+    if header is None:
+        pieces.append(
+            _format_record( fieldnames, [ False ] * len( fieldnames ),
+                            terminator ) )
+        changed = True
+
+    # Append rows added past the end of the file
+    for row in pending:
+        if pieces and not _line_ending( pieces[ -1 ] ):
+            pieces[ -1 ] += terminator
+        values = [ _as_text( row.get( name ) ) for name in fieldnames ]
+        quoting = _field_quoting( fieldnames, values, {}, {}, column_quoting )
+        pieces.append( _format_record( values, quoting, terminator ) )
+        changed = True
+
+    if not changed:
+        return False
+
+    with open( csv_file, "w", newline="" ) as f:
+        f.write( "".join( pieces ) )
+    return True
@@ -0,0 +1,322 @@
+import csv
+import hashlib
+import json
+import os
+import random
+import sys
+from collections import defaultdict
+from typing import Dict, Iterable, List, NoReturn, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from scripts.text_utils import extract_urls, row_label, strip_markdown_links, tokenize
+
+# MinHash / LSH parameters. 32 bands of 4 rows put the LSH threshold at
+# roughly (1/32) ** (1/4) ~= 0.42 estimated Jaccard similarity.
+NUM_PERM = 128
+BANDS = 32
+ROWS_PER_BAND = NUM_PERM // BANDS
+SEED = 42
+SHINGLE_SIZE = 3
+
+TEXT_FIELDS = ( "name", "summary", "Feature Highlights" )
+CACHE_FILE = ".cache/minhash_signatures.json"
+
+_MERSENNE_PRIME = ( 1 << 61 ) - 1
+_MAX_HASH = ( 1 << 32 ) - 1
+
+Permutations = List[ Tuple[ int, int ] ]
+
+
+def _hash_token( token: str ) -> int:
+    """Hash a shingle to a stable 32-bit integer."""
+    digest = hashlib.blake2b( token.encode( "utf-8" ), digest_size=4 ).digest()
+    return int.from_bytes( digest, "little" )
+
+
+def _permutations( num_perm: int = NUM_PERM,
+                   seed: int = SEED ) -> Permutations:
+    """Generate the (a, b) coefficients of the universal hash family."""
+    rng = random.Random( seed )
+    return [ ( rng.randint( 1, _MERSENNE_PRIME - 1 ),
+               rng.randint( 0, _MERSENNE_PRIME - 1 ) )
+             for _ in range( num_perm ) ]
+
+
+def normalize_link( url: str ) -> str:
+    """Normalize a URL to a lowercase host/path key.
+
+    Scheme, ``www.`` prefix, query string, fragment, trailing slashes and a
+    trailing ``.git`` are dropped so that trivially different spellings of
+    the same link compare equal.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        str: Normalized ``host/path`` string, or an empty string
+    """
+    parsed = urlparse( url.strip().lower() )
+    host = parsed.netloc
+    if host.startswith( "www." ):
+        host = host[ 4: ]
+    path = parsed.path.rstrip( "/" )
+    if path.endswith( ".git" ):
+        path = path[ :-4 ]
+    return f"{host}{path}" if host else ""
+
+
+def shingle_row( row: Dict[ str, str ], k: int = SHINGLE_SIZE ) -> Set[ str ]:
+    """Build the shingle set for a catalog row.
+
+    Text fields contribute word k-shingles; links found in the ``name`` and
+    ``links`` columns contribute their normalized host/path and final path
+    segment, so forks of the same repository still share a shingle.
+
+    Args:
+        row: Dictionary containing row data
+        k: Number of words per shingle
+
+    Returns:
+        Set[str]: Shingles for the row
+    """
+    shingles: Set[ str ] = set()
+
+    for field in TEXT_FIELDS:
+        tokens = tokenize( strip_markdown_links( row.get( field ) or "" ) )
+        if not tokens:
+            continue
+        if field == "name":
+            shingles.add( "name:" + " ".join( tokens ) )
+        if len( tokens ) < k:
+            shingles.add( "text:" + " ".join( tokens ) )
+        for i in range( len( tokens ) - k + 1 ):
+            shingles.add( "text:" + " ".join( tokens[ i:i + k ] ) )
+
+    urls = extract_urls( row.get( "name" ) or "" ) + extract_urls(
+        row.get( "links" ) or "" )
+    for url in urls:
+        link = normalize_link( url )
+        if not link:
+            continue
+        shingles.add( "link:" + link )
+        segments = link.split( "/" )
+        if len( segments ) > 1:
+            shingles.add( "slug:" + segments[ -1 ] )
+
+    return shingles
+
+
+def minhash_signature(
+        shingles: Iterable[ str ],
+        permutations: Optional[ Permutations ] = None ) -> List[ int ]:
+    """Compute the MinHash signature of a shingle set.
+
+    Args:
+        shingles: Shingles to hash
+        permutations: Hash family coefficients, defaults to ``_permutations()``
+
+    Returns:
+        List[int]: One minimum per permutation; all ``_MAX_HASH`` when empty
+    """
+    perms = permutations if permutations is not None else _permutations()
+    hashes = [ _hash_token( s ) for s in set( shingles ) ]
+    if not hashes:
+        return [ _MAX_HASH ] * len( perms )
+    return [
+        min( ( ( a * h + b ) % _MERSENNE_PRIME ) & _MAX_HASH for h in hashes )
+        for a, b in perms
+    ]
+
+
+def estimate_similarity( sig_a: List[ int ], sig_b: List[ int ] ) -> float:
+    """Estimate the Jaccard similarity of two MinHash signatures."""
+    if not sig_a or len( sig_a ) != len( sig_b ):
+        return 0.0
+    matches = sum( 1 for a, b in zip( sig_a, sig_b ) if a == b )
+    return matches / len( sig_a )
+
+
+def lsh_candidate_pairs(
+        signatures: Dict[ str, List[ int ] ],
+        bands: int = BANDS,
+        rows: int = ROWS_PER_BAND ) -> Set[ Tuple[ str, str ] ]:
+    """Find candidate duplicate pairs with LSH banding.
+
+    Each signature is split into ``bands`` bands of ``rows`` values; keys that
+    share any band bucket become a candidate pair. Only colliding keys are
+    paired, so the cost grows with the number of collisions rather than with
+    the square of the number of rows.
+
+    Args:
+        signatures: Mapping of row key to MinHash signature
+        bands: Number of bands
+        rows: Number of signature values per band
+
+    Returns:
+        Set[Tuple[str, str]]: Sorted key pairs that collided in some band
+    """
+    candidates: Set[ Tuple[ str, str ] ] = set()
+    for band in range( bands ):
+        buckets: Dict[ Tuple[ int, ...], List[ str ] ] = defaultdict( list )
+        start = band * rows
+        for key, signature in signatures.items():
+            buckets[ tuple( signature[ start:start + rows ] ) ].append( key )
+        for keys in buckets.values():
+            for i in range( len( keys ) ):
+                for j in range( i + 1, len( keys ) ):
+                    pair = ( keys[ i ], keys[ j ] )
+                    candidates.add( ( min( pair ), max( pair ) ) )
+    return candidates
+
+
+def row_hash( row: Dict[ str, str ] ) -> str:
+    """Hash the fields of a row that contribute to its signature."""
+    payload = json.dumps(
+        {
+            field: row.get( field ) or ""
+            for field in TEXT_FIELDS + ( "links", )
+        },
+        sort_keys=True )
+    return hashlib.sha256( payload.encode( "utf-8" ) ).hexdigest()
+
+
+def _cache_params() -> Dict[ str, int ]:
+    """Parameters that invalidate the signature cache when changed."""
+    return { "num_perm": NUM_PERM, "seed": SEED, "shingle_size": SHINGLE_SIZE }
+
+
+def load_signature_cache( cache_file: str ) -> Dict[ str, List[ int ] ]:
+    """Load cached signatures keyed by row hash.
+
+    A missing, unreadable or stale (different parameters) cache is treated as
+    empty.
+    """
+    try:
+        with open( cache_file, "r" ) as f:
+            data = json.load( f )
+    except ( FileNotFoundError, json.JSONDecodeError ):
+        return {}
+    if not isinstance( data, dict ) or data.get( "params" ) != _cache_params():
+        logger.info( "Signature cache parameters changed, rebuilding." )
+        return {}
+    signatures: Dict[ str, List[ int ] ] = data.get( "signatures", {} )
+    return signatures
+
+
+def save_signature_cache( cache_file: str,
+                          signatures: Dict[ str, List[ int ] ] ) -> None:
+    """Write signatures keyed by row hash to the cache file."""
+    directory = os.path.dirname( cache_file )
+    if directory:
+        os.makedirs( directory, exist_ok=True )
+    with open( cache_file, "w" ) as f:
+        json.dump( { "params": _cache_params(), "signatures": signatures }, f )
+
+
+def find_duplicates(
+        csv_file: str = "table.csv",
+        cache_file: Optional[ str ] = CACHE_FILE,
+        threshold: float = 0.5 ) -> List[ Tuple[ str, str, float ] ]:
+    """Find likely duplicate rows in the catalog CSV.
+
+    Signatures are reused from ``cache_file`` for rows whose hash is
+    unchanged, so reruns only shingle and hash new or edited rows.
+
+    Args:
+        csv_file: Path to the CSV file
+        cache_file: Path to the signature cache, or None to disable caching
+        threshold: Minimum estimated Jaccard similarity to report
+
+    Returns:
+        List[Tuple[str, str, float]]: (name, name, similarity), most similar
+        first
+    """
+    with open( csv_file, "r", newline="" ) as f:
+        rows = list( csv.DictReader( f ) )
+
+    cache = load_signature_cache( cache_file ) if cache_file else {}
+    permutations = _permutations()
+    signatures: Dict[ str, List[ int ] ] = {}
+    fresh_cache: Dict[ str, List[ int ] ] = {}
+    computed = 0
+
+    for index, row in enumerate( rows ):
+        digest = row_hash( row )
+        signature = cache.get( digest )
+        if signature is None:
+            shingles = shingle_row( row )
+            if not shingles:
+                continue
+            signature = minhash_signature( shingles, permutations )
+            computed += 1
+        fresh_cache[ digest ] = signature
+        signatures[ str( index ) ] = signature
+
+    logger.info(
+        f"Computed {computed} of {len(signatures)} MinHash signatures "
+        f"({len(signatures) - computed} cached)." )
+
+    if cache_file and ( computed or set( fresh_cache ) != set( cache ) ):
+        save_signature_cache( cache_file, fresh_cache )
+
+    results: List[ Tuple[ str, str, float ] ] = []
+    for key_a, key_b in lsh_candidate_pairs( signatures ):
+        similarity = estimate_similarity( signatures[ key_a ],
+                                          signatures[ key_b ] )
+        if similarity >= threshold:
+            results.append( ( row_label( rows[ int( key_a ) ] ),
+                              row_label( rows[ int( key_b ) ] ), similarity ) )
+
+    results.sort( key=lambda item: ( -item[ 2 ], item[ 0 ], item[ 1 ] ) )
+    return results
+
+
+def format_duplicate_report(
+        duplicates: List[ Tuple[ str, str, float ] ] ) -> str:
+    """Format duplicate pairs as a markdown table.
+
+    Args:
+        duplicates: Ranked (name, name, similarity) tuples
+
+    Returns:
+        str: Markdown report
+    """
+    if not duplicates:
+        return "No likely duplicates found.\n"
+    lines = [
+        "| rank | tool | possible duplicate | similarity |",
+        "|:---:|:---:|:---:|:---:|"
+    ]
+    for rank, ( name_a, name_b, similarity ) in enumerate( duplicates, 1 ):
+        lines.append( f"| {rank} | {name_a} | {name_b} | {similarity:.2f} |" )
+    return "\n".join( lines ) + "\n"
+
+
+def main() -> None:
+    """Main function to report likely duplicate catalog entries."""
+    logger.remove()
+    logger.add( "logs/detect_duplicates.log",
+                rotation="1 MB",
+                format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+                level="INFO" )
+    logger.add( sys.stderr, level="INFO" )
+
+    duplicates = find_duplicates( "table.csv" )
+    logger.info( f"Found {len(duplicates)} likely duplicate pairs." )
+    print( format_duplicate_report( duplicates ), end="" )
+
+
+def run() -> NoReturn:
+    """Entry point for the script."""
+    try:
+        main()
+        sys.exit( 0 )
+    except Exception as e:
+        logger.error( f"Unexpected error: {e}" )
+        sys.exit( 1 )
+
+
+if __name__ == "__main__":
+    run()
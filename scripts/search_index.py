@@ -0,0 +1,261 @@
+import csv
+import gzip
+import hashlib
+import json
+import math
+import re
+import sys
+from collections import defaultdict
+from typing import Any, Dict, List, NoReturn, Optional
+
+from loguru import logger
+
+from scripts.text_utils import BOOLEAN_VALUES, extract_urls, row_label, tokenize
+
+INDEX_VERSION = 1
+INDEX_FILE = "search_index.json.gz"
+
+# Text fields to index and the weight each occurrence contributes
+FIELD_WEIGHTS = {
+    "name": 3,
+    "summary": 1,
+    "Feature Highlights": 1,
+    "dependencies": 1,
+}
+PROVIDER_PREFIX = "provider:"
+PROVIDER_WEIGHT = 1
+
+_QUERY_PATTERN = re.compile( PROVIDER_PREFIX + r"[a-z0-9_]+|[a-z0-9]+" )
+
+
+def provider_fields( rows: List[ Dict[ str, str ] ],
+                     fieldnames: List[ str ] ) -> List[ str ]:
+    """Return the provider flag columns (columns holding only True/False).
+
+    Args:
+        rows: CSV rows
+        fieldnames: CSV header
+
+    Returns:
+        List[str]: Provider flag column names in header order
+    """
+    flags = []
+    for field in fieldnames:
+        values = { ( row.get( field ) or "" ).strip() for row in rows }
+        values.discard( "" )
+        if values and values <= BOOLEAN_VALUES:
+            flags.append( field )
+    return flags
+
+
+def source_hash( rows: List[ Dict[ str, str ] ],
+                 fieldnames: List[ str ] ) -> str:
+    """Hash the row values that the index is built from.
+
+    Columns that are not indexed (e.g. ``github_stars``) are excluded, so
+    changes to them do not trigger a rebuild.
+    """
+    fields = [ "links" ] + list( FIELD_WEIGHTS ) + provider_fields(
+        rows, fieldnames )
+    payload = json.dumps( [ [ row.get( field ) or "" for field in fields ]
+                            for row in rows ] + [ fields ] )
+    return hashlib.sha256( payload.encode( "utf-8" ) ).hexdigest()
+
+
+def _document_link( row: Dict[ str, str ] ) -> str:
+    """Return the primary link of a row (the name link, else first link)."""
+    urls = extract_urls( row.get( "name" ) or "" ) + extract_urls(
+        row.get( "links" ) or "" )
+    return urls[ 0 ] if urls else ""
+
+
+def build_search_index( rows: List[ Dict[ str, str ] ],
+                        fieldnames: List[ str ] ) -> Dict[ str, Any ]:
+    """Build an inverted index over the catalog rows.
+
+    Document IDs are row positions. Each posting list is a flat list of
+    ``[id_delta, weight, id_delta, weight, ...]`` with IDs in ascending order
+    and delta-encoded to keep the serialized index small.
+
+    Args:
+        rows: CSV rows
+        fieldnames: CSV header
+
+    Returns:
+        Dict[str, Any]: Serializable index
+    """
+    flags = provider_fields( rows, fieldnames )
+    weights: Dict[ str, Dict[ int, int ] ] = defaultdict( dict )
+
+    for doc_id, row in enumerate( rows ):
+        for field, weight in FIELD_WEIGHTS.items():
+            text = row_label( row ) if field == "name" else row.get( field )
+            for token in tokenize( text or "" ):
+                postings = weights[ token ]
+                postings[ doc_id ] = postings.get( doc_id, 0 ) + weight
+        for flag in flags:
+            if ( row.get( flag ) or "" ).strip() == "True":
+                weights[ PROVIDER_PREFIX + flag.lower() ][ doc_id ] = \
+                    PROVIDER_WEIGHT
+
+    postings_out: Dict[ str, List[ int ] ] = {}
+    for term in sorted( weights ):
+        encoded: List[ int ] = []
+        previous = 0
+        for doc_id in sorted( weights[ term ] ):
+            encoded.extend( [ doc_id - previous, weights[ term ][ doc_id ] ] )
+            previous = doc_id
+        postings_out[ term ] = encoded
+
+    return {
+        "version": INDEX_VERSION,
+        "source_hash": source_hash( rows, fieldnames ),
+        "providers": [ flag.lower() for flag in flags ],
+        "docs":
+        [ [ row_label( row ), _document_link( row ) ] for row in rows ],
+        "postings": postings_out,
+    }
+
+
+def load_search_index( index_file: str = INDEX_FILE ) -> Dict[ str, Any ]:
+    """Load a gzip-compressed JSON search index."""
+    with gzip.open( index_file, "rt", encoding="utf-8" ) as f:
+        index: Dict[ str, Any ] = json.load( f )
+    return index
+
+
+def write_search_index( index: Dict[ str, Any ],
+                        index_file: str = INDEX_FILE ) -> None:
+    """Write the index as compact, gzip-compressed JSON.
+
+    The gzip header timestamp and file name are fixed so identical indexes
+    produce identical bytes regardless of when or where they are written.
+    """
+    data = json.dumps( index, separators=( ",", ":" ),
+                       ensure_ascii=False ).encode( "utf-8" )
+    with open( index_file, "wb" ) as raw:
+        with gzip.GzipFile( filename="", fileobj=raw, mode="wb",
+                            mtime=0 ) as f:
+            f.write( data )
+
+
+def _stored_source_hash( index_file: str ) -> Optional[ str ]:
+    """Return the source hash of an existing index, if it is readable."""
+    try:
+        index = load_search_index( index_file )
+    except ( FileNotFoundError, OSError, EOFError, json.JSONDecodeError ):
+        return None
+    if index.get( "version" ) != INDEX_VERSION:
+        return None
+    return index.get( "source_hash" )
+
+
+def export_search_index( csv_file: str = "table.csv",
+                         index_file: str = INDEX_FILE ) -> bool:
+    """Export the search index for a CSV file if its indexed rows changed.
+
+    Args:
+        csv_file: Path to the CSV file
+        index_file: Path to the compressed index artifact
+
+    Returns:
+        bool: True if the index was rebuilt, False if it was up to date
+    """
+    with open( csv_file, "r", newline="" ) as f:
+        reader = csv.DictReader( f )
+        rows = list( reader )
+        fieldnames = list( reader.fieldnames or [] )
+
+    current_hash = source_hash( rows, fieldnames )
+    if _stored_source_hash( index_file ) == current_hash:
+        logger.info( "Search index is up to date." )
+        return False
+
+    write_search_index( build_search_index( rows, fieldnames ), index_file )
+    logger.info( f"Search index written to {index_file}." )
+    return True
+
+
+def _decode_postings( encoded: List[ int ] ) -> Dict[ int, int ]:
+    """Decode a delta-encoded posting list into {doc_id: weight}."""
+    postings = {}
+    doc_id = 0
+    for i in range( 0, len( encoded ), 2 ):
+        doc_id += encoded[ i ]
+        postings[ doc_id ] = encoded[ i + 1 ]
+    return postings
+
+
+def search( index: Dict[ str, Any ],
+            query: str,
+            limit: int = 10 ) -> List[ Dict[ str, Any ] ]:
+    """Query a search index.
+
+    All query terms must match (AND semantics). Provider flags are queried
+    with ``provider:<name>`` terms, e.g. ``"citation provider:openai"``.
+    Results are ranked by the sum of weight * IDF over the query terms.
+
+    Args:
+        index: Index returned by ``build_search_index``/``load_search_index``
+        query: Free-text query
+        limit: Maximum number of results
+
+    Returns:
+        List[Dict[str, Any]]: Results with ``id``, ``name``, ``link`` and
+        ``score``, best first
+    """
+    terms = list( dict.fromkeys( _QUERY_PATTERN.findall( query.lower() ) ) )
+    if not terms:
+        return []
+
+    docs = index[ "docs" ]
+    scores: Optional[ Dict[ int, float ] ] = None
+    for term in terms:
+        encoded = index[ "postings" ].get( term )
+        if not encoded:
+            return []
+        postings = _decode_postings( encoded )
+        idf = math.log( 1 + len( docs ) / len( postings ) )
+        if scores is None:
+            scores = dict.fromkeys( postings, 0.0 )
+        else:
+            scores = {
+                doc_id: score
+                for doc_id, score in scores.items() if doc_id in postings
+            }
+        for doc_id in scores:
+            scores[ doc_id ] += postings[ doc_id ] * idf
+
+    ranked = sorted( ( scores or {} ).items(),
+                     key=lambda item: ( -item[ 1 ], item[ 0 ] ) )
+    return [ {
+        "id": doc_id,
+        "name": docs[ doc_id ][ 0 ],
+        "link": docs[ doc_id ][ 1 ],
+        "score": round( score, 4 ),
+    } for doc_id, score in ranked[ :limit ] ]
+
+
+def main() -> None:
+    """Rebuild the index if needed and optionally run a query from argv."""
+    export_search_index( "table.csv", INDEX_FILE )
+    query = " ".join( sys.argv[ 1: ] )
+    if query:
+        for result in search( load_search_index( INDEX_FILE ), query ):
+            print(
+                f"{result['score']:>8.3f}  {result['name']}  {result['link']}"
+            )
+
+
+def run() -> NoReturn:
+    """Entry point for the script."""
+    try:
+        main()
+        sys.exit( 0 )
+    except Exception as e:
+        logger.error( f"Unexpected error: {e}" )
+        sys.exit( 1 )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,37 @@
+import re
+from typing import Dict, List
+
+BOOLEAN_VALUES = { "True", "False" }
+
+_MD_LINK_PATTERN = re.compile( r"\[([^\]]*)\]\(([^)]*)\)" )
+_URL_PATTERN = re.compile( r"https?://[^\s,)\]]+" )
+_TOKEN_PATTERN = re.compile( r"[a-z0-9]+" )
+
+
+def tokenize( text: str ) -> List[ str ]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_PATTERN.findall( text.lower() ) if text else []
+
+
+def extract_urls( text: str ) -> List[ str ]:
+    """Extract all URLs from a string of markdown links or bare URLs.
+
+    Args:
+        text: String that may contain markdown links and/or bare URLs
+
+    Returns:
+        List[str]: URLs in order of appearance
+    """
+    if not text:
+        return []
+    return _URL_PATTERN.findall( text )
+
+
+def strip_markdown_links( text: str ) -> str:
+    """Replace markdown links with their label text."""
+    return _MD_LINK_PATTERN.sub( r"\1", text )
+
+
+def row_label( row: Dict[ str, str ] ) -> str:
+    """Human-readable label for a row (the name without markdown link)."""
+    return strip_markdown_links( row.get( "name" ) or "" ).strip()
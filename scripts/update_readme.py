@@ -7,6 +7,7 @@ from typing import Dict, List, NoReturn
 from loguru import logger
 from rich.console import Console
 
+from scripts.search_index import INDEX_FILE, export_search_index
 from scripts.update_stars import update_csv_with_stars
 
 # Initialize Rich console
@@ -143,7 +144,7 @@ def update_readme_table( readme_file: str, csv_file: str ) -> None:
 
 
 async def main() -> None:
-    """Main function to update both star counts and README."""
+    """Main function to update star counts, README and search index."""
     try:
         # Configure logging
         logger.remove()                                                        # Remove default handler
@@ -161,6 +162,10 @@ async def main() -> None:
         logger.info( "Updating README table..." )
         update_readme_table( 'README.md', 'table.csv' )
 
+        # Then refresh the static search index
+        logger.info( "Exporting search index..." )
+        export_search_index( 'table.csv', INDEX_FILE )
+
         logger.info( "All updates completed successfully" )
     except FileNotFoundError as e:
         logger.error( f"File not found: {e}" )
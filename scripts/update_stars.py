@@ -7,6 +7,8 @@ from typing import Dict, List, Optional, Tuple
 import aiohttp
 from loguru import logger
 
+from scripts.csv_writer import write_csv_minimal_diff
+
 # Configure logger
 logger.add( "logs/update_stars.log", rotation="1 MB" )
 
@@ -85,8 +87,8 @@ async def update_csv_with_stars( csv_file: str = "table.csv" ) -> None:
     rows: List[ Dict[ str, str ] ] = []
     fieldnames: List[ str ] = []
 
-    # Read existing CSV
-    with open( csv_file, "r" ) as f:
+    # Read existing CSV, keeping line endings inside quoted fields intact
+    with open( csv_file, "r", newline="" ) as f:
         reader = csv.DictReader( f )
         fieldnames = reader.fieldnames or []
         rows = [ row for row in reader ]
@@ -100,13 +102,11 @@ async def update_csv_with_stars( csv_file: str = "table.csv" ) -> None:
         tasks = [ process_row( session, row ) for row in rows ]
         updated_rows = await asyncio.gather( *tasks )
 
-    # Write updated CSV
-    with open( csv_file, "w", newline="" ) as f:
-        writer = csv.DictWriter( f, fieldnames=fieldnames )
-        writer.writeheader()
-        writer.writerows( updated_rows )
-
-    logger.info( f"Updated {csv_file} with GitHub star counts" )
+    # Write updated CSV, rewriting only rows whose values changed
+    if write_csv_minimal_diff( csv_file, updated_rows, fieldnames ):
+        logger.info( f"Updated {csv_file} with GitHub star counts" )
+    else:
+        logger.info( f"No GitHub star count changes for {csv_file}" )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,157 @@
+import csv
+import io
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+from scripts.csv_writer import (
+    _format_record,
+    _quoted_fields,
+    _split_records,
+    write_csv_minimal_diff,
+)
+
+TABLE_CSV = Path( __file__ ).resolve().parent.parent / "table.csv"
+
+
+def read_rows(
+        csv_file: Path ) -> Tuple[ List[ Dict[ str, str ] ], List[ str ] ]:
+    with open( csv_file, "r", newline="" ) as f:
+        reader = csv.DictReader( f )
+        return list( reader ), list( reader.fieldnames or [] )
+
+
+@pytest.fixture
+def table_copy( tmp_path ):
+    csv_file = tmp_path / "table.csv"
+    csv_file.write_bytes( TABLE_CSV.read_bytes() )
+    return csv_file
+
+
+def test_table_csv_records_round_trip():
+    # Re-serializing every record with its own quoting reproduces the file
+    content = TABLE_CSV.read_bytes().decode( "utf-8" )
+    records = list( _split_records( io.StringIO( content, newline="" ) ) )
+    assert "".join( raw for _, raw in records ) == content
+    for fields, raw in records:
+        ending = raw[ len( raw.rstrip( "\r\n" ) ): ]
+        assert _format_record( fields, _quoted_fields( raw ), ending ) == raw
+
+
+def test_unchanged_rows_skip_write( table_copy ):
+    rows, fieldnames = read_rows( table_copy )
+    mtime = table_copy.stat().st_mtime_ns
+
+    assert not write_csv_minimal_diff( str( table_copy ), rows, fieldnames )
+    assert table_copy.read_bytes() == TABLE_CSV.read_bytes()
+    assert table_copy.stat().st_mtime_ns == mtime
+
+
+def test_changed_row_only_rewrites_that_row( table_copy ):
+    rows, fieldnames = read_rows( table_copy )
+    status = rows[ 2 ][ "maintenance_status" ]
+    rows[ 2 ][ "maintenance_status" ] = "Archived"
+
+    assert write_csv_minimal_diff( str( table_copy ), rows, fieldnames )
+
+    original = TABLE_CSV.read_bytes().splitlines( keepends=True )
+    updated = table_copy.read_bytes().splitlines( keepends=True )
+    assert len( updated ) == len( original )
+    diff = [
+        i for i, ( a, b ) in enumerate( zip( original, updated ) ) if a != b
+    ]
+    assert diff == [ 3 ]
+    assert updated[ 3 ] == original[ 3 ].replace( f'"{status}"'.encode(),
+                                                  b'"Archived"' )
+
+    # Reverting the value restores the original bytes
+    rows[ 2 ][ "maintenance_status" ] = status
+    assert write_csv_minimal_diff( str( table_copy ), rows, fieldnames )
+    assert table_copy.read_bytes() == TABLE_CSV.read_bytes()
+
+
+def test_new_column_keeps_existing_quoting( table_copy ):
+    rows, fieldnames = read_rows( table_copy )
+    fieldnames.append( "github_stars" )
+    rows[ 0 ][ "github_stars" ] = "42"
+    for row in rows[ 1: ]:
+        row[ "github_stars" ] = "N/A"
+
+    assert write_csv_minimal_diff( str( table_copy ), rows, fieldnames )
+
+    original = TABLE_CSV.read_bytes().splitlines( keepends=True )
+    updated = table_copy.read_bytes().splitlines( keepends=True )
+    assert updated[ 0 ] == original[ 0 ].replace( b"\n", b",github_stars\n" )
+    assert updated[ 1 ] == original[ 1 ].replace( b"\n", b",42\n" )
+    assert updated[ 2 ] == original[ 2 ].replace( b"\n", b',"N/A"\n' )
+    assert read_rows( table_copy )[ 0 ] == rows
+
+
+def test_value_kind_change_uses_column_quoting( table_copy ):
+    rows, fieldnames = read_rows( table_copy )
+    fieldnames.append( "github_stars" )
+    rows[ 0 ][ "github_stars" ] = "123"
+    for row in rows[ 1: ]:
+        row[ "github_stars" ] = "N/A"
+    write_csv_minimal_diff( str( table_copy ), rows, fieldnames )
+    before = table_copy.read_bytes().splitlines( keepends=True )
+
+    # N/A -> count is written unquoted like the other counts
+    rows, fieldnames = read_rows( table_copy )
+    rows[ 2 ][ "github_stars" ] = "5"
+    assert write_csv_minimal_diff( str( table_copy ), rows, fieldnames )
+    after = table_copy.read_bytes().splitlines( keepends=True )
+    assert after[ 3 ] == before[ 3 ].replace( b',"N/A"\n', b",5\n" )
+
+    # count -> N/A is quoted again, count -> count keeps its quoting
+    rows[ 0 ][ "github_stars" ] = "124"
+    rows[ 2 ][ "github_stars" ] = "N/A"
+    assert write_csv_minimal_diff( str( table_copy ), rows, fieldnames )
+    final = table_copy.read_bytes().splitlines( keepends=True )
+    assert final[ 1 ] == before[ 1 ].replace( b",123\n", b",124\n" )
+    assert final[ 3 ] == before[ 3 ]
+
+
+def test_special_characters_and_line_endings( tmp_path ):
+    csv_file = tmp_path / "crlf.csv"
+    csv_file.write_bytes(
+        b'name,notes,flag\r\nA,"multi\r\nline",True\r\nB,plain,False' )
+    rows, fieldnames = read_rows( csv_file )
+    rows[ 1 ][ "notes" ] = 'says "hi", twice'
+
+    assert write_csv_minimal_diff( str( csv_file ), rows, fieldnames )
+    assert csv_file.read_bytes() == (
+        b'name,notes,flag\r\nA,"multi\r\nline",True\r\n'
+        b'B,"says ""hi"", twice",False' )
+
+    # Appended rows follow the quoting of the last existing row
+    rows.append( { "name": "C", "notes": "new", "flag": "True" } )
+    assert write_csv_minimal_diff( str( csv_file ), rows, fieldnames )
+    assert csv_file.read_bytes().endswith(
+        b'twice",False\r\nC,"new",True\r\n' )
+    assert read_rows( csv_file )[ 0 ] == rows
+
+
+def test_removed_rows_and_blank_lines( tmp_path ):
+    csv_file = tmp_path / "rows.csv"
+    csv_file.write_text( "name,value\nA,1\n\nB,2\nC,3\n" )
+    rows, fieldnames = read_rows( csv_file )
+
+    assert write_csv_minimal_diff( str( csv_file ), rows[ :2 ], fieldnames )
+    assert csv_file.read_text() == "name,value\nA,1\n\nB,2\n"
+
+
+def test_empty_file( tmp_path ):
+    csv_file = tmp_path / "empty.csv"
+    csv_file.write_text( "" )
+
+    assert write_csv_minimal_diff( str( csv_file ), [ {
+        "name": "A"
+    } ], [ "name" ] )
+    assert csv_file.read_text() == 'name\n"A"\n'
+
+
+def test_file_not_found():
+    with pytest.raises( FileNotFoundError ):
+        write_csv_minimal_diff( "nonexistent.csv", [], [ "name" ] )
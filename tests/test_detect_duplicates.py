@@ -0,0 +1,131 @@
+import json
+
+import pytest
+
+import scripts.detect_duplicates as detect_duplicates
+from scripts.detect_duplicates import (
+    NUM_PERM,
+    estimate_similarity,
+    find_duplicates,
+    format_duplicate_report,
+    load_signature_cache,
+    lsh_candidate_pairs,
+    minhash_signature,
+    normalize_link,
+    row_hash,
+    shingle_row,
+)
+
+# Two entries for the same project (a fork under a new name) and one unrelated
+SAMPLE_CSV_CONTENT = """name,summary,Feature Highlights,links
+"[DeepSearch](https://github.com/alice/deep-search)","Autonomous agent that iteratively searches the web and writes cited research reports","Iterative search loop | Citation tracking | Markdown reports","[GitHub](https://github.com/alice/deep-search)"
+"[DeepSearch Plus](https://github.com/bob/deep-search/)","Autonomous agent that iteratively searches the web and writes cited research reports with extras","Iterative search loop | Citation tracking | Markdown reports","[GitHub](https://www.github.com/bob/deep-search.git)"
+"[PaperQA](https://github.com/carol/paper-qa)","Question answering over scientific PDFs using retrieval augmented generation","PDF parsing | Vector store | Answer grading",""
+"""
+
+
+@pytest.fixture
+def sample_csv( tmp_path ):
+    csv_file = tmp_path / "table.csv"
+    csv_file.write_text( SAMPLE_CSV_CONTENT )
+    return csv_file
+
+
+def test_normalize_link():
+    assert normalize_link(
+        "https://www.GitHub.com/Owner/Repo.git/" ) == "github.com/owner/repo"
+    assert normalize_link(
+        "http://example.com/page?x=1#top" ) == "example.com/page"
+    assert normalize_link( "not a url" ) == ""
+
+
+def test_shingle_row():
+    row = {
+        "name": "[Tool](https://github.com/owner/tool)",
+        "summary": "One two three four",
+        "links": ""
+    }
+    shingles = shingle_row( row )
+    assert "name:tool" in shingles
+    assert "text:one two three" in shingles
+    assert "text:two three four" in shingles
+    assert "link:github.com/owner/tool" in shingles
+    assert "slug:tool" in shingles
+    assert shingle_row( {} ) == set()
+
+
+def test_minhash_signature_similarity():
+    sig_a = minhash_signature( { "a", "b", "c", "d" } )
+    sig_b = minhash_signature( { "a", "b", "c", "d" } )
+    sig_c = minhash_signature( { "w", "x", "y", "z" } )
+    assert len( sig_a ) == NUM_PERM
+    assert estimate_similarity( sig_a, sig_b ) == 1.0
+    assert estimate_similarity( sig_a, sig_c ) < 0.2
+    assert estimate_similarity( sig_a, [] ) == 0.0
+
+
+def test_lsh_candidate_pairs():
+    shared = minhash_signature( { "a", "b", "c" } )
+    other = minhash_signature( { "x", "y", "z" } )
+    pairs = lsh_candidate_pairs( { "2": shared, "1": shared, "3": other } )
+    assert pairs == { ( "1", "2" ) }
+
+
+def test_find_duplicates( sample_csv, tmp_path ):
+    cache_file = tmp_path / "cache" / "signatures.json"
+    duplicates = find_duplicates( str( sample_csv ), str( cache_file ) )
+
+    assert len( duplicates ) == 1
+    name_a, name_b, similarity = duplicates[ 0 ]
+    assert { name_a, name_b } == { "DeepSearch", "DeepSearch Plus" }
+    assert 0.5 <= similarity <= 1.0
+
+    cache = json.loads( cache_file.read_text() )
+    assert len( cache[ "signatures" ] ) == 3
+
+
+def test_find_duplicates_uses_cache( sample_csv, tmp_path, mocker ):
+    cache_file = tmp_path / "signatures.json"
+    first = find_duplicates( str( sample_csv ), str( cache_file ) )
+
+    spy = mocker.spy( detect_duplicates, "minhash_signature" )
+    assert find_duplicates( str( sample_csv ), str( cache_file ) ) == first
+    assert spy.call_count == 0
+
+    # Editing one row only recomputes that row
+    sample_csv.write_text(
+        SAMPLE_CSV_CONTENT.replace( "Answer grading", "Answer scoring" ) )
+    find_duplicates( str( sample_csv ), str( cache_file ) )
+    assert spy.call_count == 1
+    assert len( load_signature_cache( str( cache_file ) ) ) == 3
+
+
+def test_load_signature_cache_stale( tmp_path ):
+    cache_file = tmp_path / "signatures.json"
+    assert load_signature_cache( str( cache_file ) ) == {}
+
+    cache_file.write_text(
+        json.dumps( {
+            "params": {
+                "num_perm": 1
+            },
+            "signatures": {
+                "x": [ 1 ]
+            }
+        } ) )
+    assert load_signature_cache( str( cache_file ) ) == {}
+
+    cache_file.write_text( "not json" )
+    assert load_signature_cache( str( cache_file ) ) == {}
+
+
+def test_row_hash_ignores_unrelated_fields():
+    row = { "name": "Tool", "summary": "Summary", "github_stars": "1" }
+    assert row_hash( row ) == row_hash( { **row, "github_stars": "2" } )
+    assert row_hash( row ) != row_hash( { **row, "summary": "Other" } )
+
+
+def test_format_duplicate_report():
+    assert format_duplicate_report( [] ) == "No likely duplicates found.\n"
+    report = format_duplicate_report( [ ( "A", "B", 0.875 ) ] )
+    assert "| 1 | A | B | 0.88 |" in report
@@ -0,0 +1,129 @@
+import gzip
+import json
+
+import pytest
+
+from scripts.search_index import (
+    build_search_index,
+    export_search_index,
+    load_search_index,
+    provider_fields,
+    search,
+    source_hash,
+    write_search_index,
+)
+
+SAMPLE_CSV_CONTENT = """name,summary,Feature Highlights,dependencies,links,OPENAI,GEMINI,github_stars
+"[Researcher](https://github.com/owner/researcher)","Research agent with citation management","Citation tracking | Reports","Python, aiohttp","",True,False,10
+"[Scholar](https://scholar.example.com)","Academic paper search","Paper search | Citation graph","","[Docs](https://docs.example.com)",False,True,N/A
+"[Notebook](https://github.com/owner/notebook)","Notebook for research notes","Markdown export","Python","",True,True,5
+"""
+
+
+@pytest.fixture
+def sample_csv( tmp_path ):
+    csv_file = tmp_path / "table.csv"
+    csv_file.write_text( SAMPLE_CSV_CONTENT )
+    return csv_file
+
+
+@pytest.fixture
+def sample_index( sample_csv, tmp_path ):
+    index_file = tmp_path / "index.json.gz"
+    export_search_index( str( sample_csv ), str( index_file ) )
+    return load_search_index( str( index_file ) )
+
+
+def test_provider_fields():
+    rows = [ {
+        "a": "True",
+        "b": "x",
+        "c": ""
+    }, {
+        "a": "False",
+        "b": "True"
+    } ]
+    assert provider_fields( rows, [ "a", "b", "c" ] ) == [ "a" ]
+
+
+def test_build_search_index():
+    rows = [ {
+        "name": "[Tool](https://t.io)",
+        "summary": "fast fast",
+        "X": "True"
+    }, {
+        "name": "Other",
+        "summary": "fast",
+        "X": "False"
+    } ]
+    index = build_search_index( rows, [ "name", "summary", "X" ] )
+    assert index[ "docs" ] == [ [ "Tool", "https://t.io" ], [ "Other", "" ] ]
+    assert index[ "providers" ] == [ "x" ]
+    # [id_delta, weight] pairs: doc 0 weight 2, doc 1 weight 1
+    assert index[ "postings" ][ "fast" ] == [ 0, 2, 1, 1 ]
+    # name terms are weighted 3x
+    assert index[ "postings" ][ "other" ] == [ 1, 3 ]
+    assert index[ "postings" ][ "provider:x" ] == [ 0, 1 ]
+
+
+def test_search( sample_index ):
+    names = [ r[ "name" ] for r in search( sample_index, "citation" ) ]
+    assert sorted( names ) == [ "Researcher", "Scholar" ]
+
+    results = search( sample_index, "Citation provider:openai" )
+    assert [ r[ "name" ] for r in results ] == [ "Researcher" ]
+    assert results[ 0 ][ "link" ] == "https://github.com/owner/researcher"
+
+    # Name matches outrank body matches
+    assert search( sample_index, "notebook" )[ 0 ][ "name" ] == "Notebook"
+
+    assert [
+        r[ "name" ] for r in search( sample_index, "python provider:gemini" )
+    ] == [ "Notebook" ]
+    assert search( sample_index, "missingterm" ) == []
+    assert search( sample_index, "citation missingterm" ) == []
+    assert search( sample_index, "" ) == []
+    assert len( search( sample_index, "research", limit=1 ) ) == 1
+
+
+def test_export_search_index_only_rebuilds_on_change( sample_csv, tmp_path ):
+    index_file = tmp_path / "index.json.gz"
+    assert export_search_index( str( sample_csv ), str( index_file ) )
+    original = index_file.read_bytes()
+    assert json.loads( gzip.decompress( original ) )[ "version" ] == 1
+
+    # Unchanged rows and non-indexed columns do not trigger a rebuild
+    assert not export_search_index( str( sample_csv ), str( index_file ) )
+    sample_csv.write_text( SAMPLE_CSV_CONTENT.replace( ",10\n", ",11\n" ) )
+    assert not export_search_index( str( sample_csv ), str( index_file ) )
+    assert index_file.read_bytes() == original
+
+    sample_csv.write_text( SAMPLE_CSV_CONTENT.replace( "Markdown", "HTML" ) )
+    assert export_search_index( str( sample_csv ), str( index_file ) )
+    assert search( load_search_index( str( index_file ) ), "html" )
+
+
+def test_export_search_index_corrupt_artifact( sample_csv, tmp_path ):
+    index_file = tmp_path / "index.json.gz"
+    index_file.write_bytes( b"not gzip" )
+    assert export_search_index( str( sample_csv ), str( index_file ) )
+
+
+def test_source_hash_ignores_unindexed_columns():
+    rows = [ { "name": "A", "github_stars": "1" } ]
+    changed = [ { "name": "A", "github_stars": "2" } ]
+    assert source_hash( rows, [ "name", "github_stars" ] ) == source_hash(
+        changed, [ "name", "github_stars" ] )
+
+
+def test_write_search_index_is_path_independent( tmp_path ):
+    index = build_search_index( [ {
+        "name": "Tool",
+        "summary": "fast"
+    } ], [ "name", "summary" ] )
+    first = tmp_path / "a" / "index.json.gz"
+    second = tmp_path / "other.gz"
+    first.parent.mkdir()
+    write_search_index( index, str( first ) )
+    write_search_index( index, str( second ) )
+    assert first.read_bytes() == second.read_bytes()
@@ -0,0 +1,31 @@
+from scripts.text_utils import (
+    extract_urls,
+    row_label,
+    strip_markdown_links,
+    tokenize,
+)
+
+
+def test_tokenize():
+    assert tokenize( "GPT-4, Python 3" ) == [ "gpt", "4", "python", "3" ]
+    assert tokenize( "" ) == []
+
+
+def test_extract_urls():
+    assert extract_urls(
+        "[GitHub](https://github.com/a/b), [Docs](https://docs.com)" ) == [
+            "https://github.com/a/b", "https://docs.com"
+        ]
+    assert extract_urls( "" ) == []
+
+
+def test_strip_markdown_links():
+    assert strip_markdown_links(
+        "See [Tool](https://t.io) and [Docs](https://d.io)"
+    ) == "See Tool and Docs"
+
+
+def test_row_label():
+    assert row_label( { "name": " [Tool](https://t.io) " } ) == "Tool"
+    assert row_label( { "name": "Plain" } ) == "Plain"
+    assert row_label( {} ) == ""
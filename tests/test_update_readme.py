@@ -138,13 +138,16 @@ async def test_main( tmp_path, mock_logger ):
     mock_update_stars = AsyncMock()
 
     with patch('scripts.update_readme.update_csv_with_stars', mock_update_stars), \
-         patch('scripts.update_readme.update_readme_table') as mock_update_table:
+         patch('scripts.update_readme.update_readme_table') as mock_update_table, \
+         patch('scripts.update_readme.export_search_index') as mock_export_index:
 
         await main()
 
         # Verify all functions were called
         mock_update_stars.assert_called_once()
         mock_update_table.assert_called_once_with( 'README.md', 'table.csv' )
+        mock_export_index.assert_called_once_with( 'table.csv',
+                                                   'search_index.json.gz' )
 
         # Verify logging setup
         mock_logger[ 'remove' ].assert_called_once()
@@ -152,6 +155,7 @@ async def test_main( tmp_path, mock_logger ):
         mock_logger[ 'info' ].assert_has_calls( [
             call( "Updating GitHub star counts..." ),
             call( "Updating README table..." ),
+            call( "Exporting search index..." ),
             call( "All updates completed successfully" )
         ] )
 
@@ -215,3 +215,29 @@ async def test_update_csv_with_stars_no_token( mock_logger ):
 
         mock_logger[ 'warning' ].assert_called_with(
             "No GITHUB_TOKEN found in environment variables" )
+
+
+@pytest.mark.asyncio
+async def test_update_csv_with_stars_preserves_unchanged_bytes( tmp_path ):
+    # CRLF file with a multi-line quoted field; star count already current
+    csv_file = tmp_path / "crlf.csv"
+    content = (
+        b'name,notes,links,github_stars\r\n'
+        b'A,"multi\r\nline","[GitHub](https://github.com/owner/repo)",100\r\n'
+        b'B,"plain",,"N/A"\r\n' )
+    csv_file.write_bytes( content )
+    mtime = csv_file.stat().st_mtime_ns
+
+    with patch( "scripts.update_stars.get_repo_stars",
+                AsyncMock( return_value=100 ) ):
+        await update_csv_with_stars( str( csv_file ) )
+
+    assert csv_file.read_bytes() == content
+    assert csv_file.stat().st_mtime_ns == mtime
+
+    # A changed star count only rewrites that record
+    with patch( "scripts.update_stars.get_repo_stars",
+                AsyncMock( return_value=101 ) ):
+        await update_csv_with_stars( str( csv_file ) )
+
+    assert csv_file.read_bytes() == content.replace( b",100\r\n", b",101\r\n" )